@@ -1,245 +1,466 @@
 import os
+import uuid
 import requests
-import json
-import time
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import streamlit as st
 import plotly.express as px
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# ODK Central details
-ODK_SERVER = os.getenv("ODK_DOMAIN")
-USERNAME = os.getenv("ODK_EMAIL")
-PASSWORD = os.getenv("ODK_PASSWORD")
-PROJECT_ID = os.getenv("PROJECT_ID")
-FORM_ID = os.getenv("FORM_ID")
-
-# Token storage file
-TOKEN_FILE = "odk_token.json"
-OUTPUT_DIR = "odk_submissions"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-CSV_FILE = f"{OUTPUT_DIR}/{FORM_ID}_submissions.csv"
-
-def get_odk_token():
-    """Generate and return a new ODK token, storing it with expiry."""
-    url = f"{ODK_SERVER}/v1/sessions"
-    headers = {"Content-Type": "application/json"}
-    data = {"email": USERNAME, "password": PASSWORD}
-
-    response = requests.post(url, json=data, headers=headers)
-    if response.status_code == 200:
-        token_data = response.json()
-        token = token_data.get("token")
-        expiry = time.time() + 3600  # Assume 1-hour token validity
-        
-        # Store token in JSON file
-        with open(TOKEN_FILE, "w") as f:
-            json.dump({"token": token, "expiry": expiry}, f)
-        return token
-    else:
-        st.error(f"Failed to get token: {response.text}")
-        return None
+from pandas.api.types import union_categoricals
+import odk_client
+from odk_client import CSV_FILE
 
-def load_token():
-    """Load a valid token or generate a new one if expired."""
-    if os.path.exists(TOKEN_FILE):
-        with open(TOKEN_FILE, "r") as f:
-            token_data = json.load(f)
-        if time.time() < token_data.get("expiry", 0):
-            return token_data["token"]
-    return get_odk_token()
+PARQUET_FILE = f"{CSV_FILE}.parquet"  # Columnar copy of the last parsed CSV
+PARQUET_MTIME_KEY = b"csv_mtime"  # Parquet schema metadata key holding the source CSV's mtime
+LARGE_CSV_BYTES = 256 * 1024 * 1024  # CSVs bigger than this are parsed in chunks to bound peak memory
+CSV_CHUNK_ROWS = 200_000
+TABLE_PAGE_ROWS = 1000  # Rows sent to the browser per page of the Full Data table
+BAR_CHART_MAX_VALUES = 50  # Numeric columns with more distinct values than this are binned in the Bar Chart
+BAR_CHART_BINS = 30  # Number of equal-width bins used when a bar chart column is binned
+CATEGORY_MAX_RATIO = 0.5  # Text columns with fewer unique values than this share of rows become categorical
+# ODK free-text answers can contain quoted newlines
+CSV_PARSE_OPTIONS = pa_csv.ParseOptions(newlines_in_values=True)
+# Dates are typed up front so Arrow parses them while reading, skipping inference and a pandas pass.
+# Low-cardinality text is dictionary-encoded while parsing, so it reaches pandas as category directly.
+CSV_COLUMN_TYPES = {"submission_date": pa.timestamp("ns", tz="UTC")}
 
 def download_csv():
-    """Download submissions as a CSV file using a valid token."""
-    token = load_token()
-    url = f"{ODK_SERVER}/v1/projects/{PROJECT_ID}/forms/{FORM_ID}/submissions.csv"
-    headers = {"Authorization": f"Bearer {token}"}
+    """Download submissions as a CSV file. Returns True if a new CSV was written."""
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 401:
-            # Token expired, regenerate and retry
-            token = get_odk_token()
-            headers["Authorization"] = f"Bearer {token}"
-            response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        with open(CSV_FILE, "wb") as f:
-            f.write(response.content)
-        st.success(f"CSV successfully downloaded to {CSV_FILE}")
+        if not odk_client.download_csv():
+            st.info("CSV is already up to date.")
+            return False
     except requests.RequestException as e:
         st.error(f"Failed to download CSV: {e}")
+        return False
+    st.success(f"CSV successfully downloaded to {CSV_FILE}")
+    return True
 
-@st.cache_data(ttl=1800)
-def load_data():
-    """Load the CSV data, ensuring it's downloaded first."""
-    download_csv()
-    if os.path.exists(CSV_FILE):
+def downcast_numbers(df):
+    """Downcast integer and float columns to the smallest dtype that holds their values."""
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes(include="floating").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    return df
+
+def concat_chunks(chunks):
+    """Concatenate parsed chunks, merging per-chunk categories so those columns stay categorical."""
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            columns[col] = pd.Series(union_categoricals(parts), name=col)
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+def read_csv_in_chunks():
+    """Parse a large CSV chunk by chunk, compacting each chunk so the full-width text is never held at once."""
+    reader = pd.read_csv(CSV_FILE, chunksize=CSV_CHUNK_ROWS, memory_map=True)
+    # Dates are parsed before compacting, so repeated dates aren't turned into a category first
+    return concat_chunks([downcast_numbers(compact_dtypes(parse_submission_dates(chunk))) for chunk in reader])
+
+def null_columns_to_float(table):
+    """Type all-empty columns as float64, as pd.read_csv does, instead of Arrow's ``null`` type."""
+    # to_pandas() would turn null columns into object columns of None, counted as categorical
+    schema = pa.schema(
+        field.with_type(pa.float64()) if pa.types.is_null(field.type) else field for field in table.schema
+    )
+    return table.cast(schema)
+
+def text_column_types(source):
+    """Map the columns Arrow would infer as timestamps, other than ``submission_date``, to string."""
+    # pd.read_csv keeps ODK's start/end/SubmissionDate as text; sniff the first block to find them
+    with pa_csv.open_csv(source, parse_options=CSV_PARSE_OPTIONS) as reader:
+        schema = reader.schema
+    source.seek(0)
+    return {
+        field.name: pa.string()
+        for field in schema
+        if pa.types.is_timestamp(field.type) and field.name != "submission_date"
+    }
+
+def read_csv_table():
+    """Parse the CSV with Arrow, typing ``submission_date`` up front when all its values are timestamps."""
+    # Memory-mapped, so Arrow parses straight from the page cache instead of copying the file into buffers
+    with pa.memory_map(CSV_FILE) as source:
+        column_types = text_column_types(source)
         try:
-            return pd.read_csv(CSV_FILE)
-        except Exception as e:
-            st.error(f"Error reading CSV file: {e}")
-            return pd.DataFrame()
-    return pd.DataFrame()
+            table = pa_csv.read_csv(
+                source,
+                parse_options=CSV_PARSE_OPTIONS,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={**CSV_COLUMN_TYPES, **column_types}, auto_dict_encode=True
+                ),
+            )
+        except pa.ArrowInvalid:
+            # A malformed date: parse untyped and let parse_submission_dates() coerce it to NaT
+            source.seek(0)
+            table = pa_csv.read_csv(
+                source,
+                parse_options=CSV_PARSE_OPTIONS,
+                convert_options=pa_csv.ConvertOptions(column_types=column_types, auto_dict_encode=True),
+            )
+    return null_columns_to_float(table)
 
-# ----------------- Streamlit App Interface -----------------
+def cached_csv_mtime():
+    """Return the mtime of the CSV the Parquet cache was built from, or None if there is no usable cache."""
+    try:
+        metadata = pq.read_schema(PARQUET_FILE).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    value = metadata.get(PARQUET_MTIME_KEY)
+    return float(value) if value is not None else None
 
-# Sidebar Filters
-st.sidebar.header("Filter Data")
-data = load_data()
-if not data.empty:
-    columns = st.sidebar.multiselect("Select Columns to Display", data.columns.tolist(), default=data.columns[:5].tolist())
-    filtered_data = data[columns]
-else:
-    filtered_data = data
-
-# Filterable Summary Section
-st.title("Evaluating Mentorship Oversight: A Comprehensive Data Analysis")
-st.write("### Filterable Column Summary")
-
-if filtered_data.empty:
-    st.write("No data loaded yet. Please download the latest CSV to see the summary.")
-else:
-    selected_column = st.selectbox("Select a Column for Summary", filtered_data.columns)
-    if selected_column:
-        st.write(f"#### Summary of {selected_column}")
-        st.write(f"- **Unique Values:** {filtered_data[selected_column].nunique()}")
-        st.write(f"- **Most Common Value:** {filtered_data[selected_column].mode()[0] if not filtered_data[selected_column].mode().empty else 'N/A'}")
-        st.write(f"- **Missing Values:** {filtered_data[selected_column].isna().sum()}")
-        st.write(f"- **Data Type:** {filtered_data[selected_column].dtype}")
-
-        if filtered_data[selected_column].dtype == 'object':
-            st.write("- **Frequent Values:**")
-            st.write(filtered_data[selected_column].value_counts().head())
+def read_submissions(mtime):
+    """Read submissions from the Parquet cache, re-parsing the CSV unless the cache was built from ``mtime``."""
+    # The cache's own mtime can't be trusted: a CSV replaced mid-parse would be older than its stale cache
+    if cached_csv_mtime() == mtime:
+        return pd.read_parquet(PARQUET_FILE)
+    # Stamped with the mtime of the CSV as it was before reading, so a CSV replaced meanwhile is re-parsed
+    source_mtime = os.path.getmtime(CSV_FILE)
+    # Written under a unique temp name and renamed, so a reader never sees a half-written cache
+    # and concurrent sessions or processes never write into the same file
+    tmp_file = f"{PARQUET_FILE}.{uuid.uuid4().hex}.part"
+    try:
+        if os.path.getsize(CSV_FILE) > LARGE_CSV_BYTES:
+            df = read_csv_in_chunks()
+            table = pa.Table.from_pandas(df, preserve_index=False)
         else:
-            st.write(f"- **Mean:** {filtered_data[selected_column].mean():.2f}")
-            st.write(f"- **Median:** {filtered_data[selected_column].median():.2f}")
-            st.write(f"- **Standard Deviation:** {filtered_data[selected_column].std():.2f}")
-
-# Existing Summary Overview
-st.header("Summary Overview")
-if filtered_data.empty:
-    st.write("No data loaded yet. Please download the latest CSV to see the summary.")
-else:
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Submissions", filtered_data.shape[0])
-    with col2:
-        numeric_cols = filtered_data.select_dtypes(include="number").columns.tolist()
-        st.metric("Numeric Columns", len(numeric_cols))
-    with col3:
-        categorical_cols = filtered_data.select_dtypes(include="object").columns.tolist()
-        st.metric("Categorical Columns", len(categorical_cols))
-    if "submission_date" in filtered_data.columns:
-        try:
-            filtered_data["submission_date"] = pd.to_datetime(filtered_data["submission_date"], errors="coerce")
-            date_range = f"{filtered_data['submission_date'].min().date()} to {filtered_data['submission_date'].max().date()}"
-            st.write(f"Date Range: {date_range}")
-        except Exception:
-            st.write("Date Range: Not available")
-
-if st.button("Download Latest CSV"):
-    download_csv()
-
-if filtered_data.empty:
-    st.warning("No data available. Click the button above to fetch the latest CSV.")
-else:
-    st.header("Tables")
-    st.subheader("Full Data")
-    st.dataframe(filtered_data, height=300)
-
-    # Summary Table
-    st.subheader("Summary")
+            # Multi-threaded Arrow parser; to_pandas() keeps numpy dtypes for the charts below
+            table = read_csv_table()
+            df = table.to_pandas()
+        metadata = {**(table.schema.metadata or {}), PARQUET_MTIME_KEY: repr(source_mtime).encode()}
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_file, compression="zstd")
+        os.replace(tmp_file, PARQUET_FILE)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    return df
+
+def parse_submission_dates(df):
+    """Parse ``submission_date`` once on load so the charts never re-run pd.to_datetime."""
+    if "submission_date" in df.columns:
+        # ODK exports ISO-8601 timestamps, which take pandas' fast fixed-format path
+        df["submission_date"] = pd.to_datetime(df["submission_date"], format="ISO8601", errors="coerce", utc=True)
+    return df
+
+def compact_dtypes(df):
+    """Convert low-cardinality text columns to category so counts run on integer codes."""
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        if len(df) and df[col].nunique() / len(df) < CATEGORY_MAX_RATIO:
+            df[col] = df[col].astype("category")
+    return df
+
+def describe_data(df):
+    """Return ``(df, numeric_cols, categorical_cols, numeric_summary)`` so reruns skip the dtype scans."""
+    # Classify every column in one walk over df.dtypes
+    numeric_cols, categorical_cols = [], []
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            numeric_cols.append(col)
+        elif pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            categorical_cols.append(col)
     if numeric_cols:
-        summary = filtered_data[numeric_cols].describe().T.reset_index().rename(columns={"index": "Column"})
+        summary = df[numeric_cols].describe().T.reset_index().rename(columns={"index": "Column"})
     else:
-        summary = pd.DataFrame({"Metric": ["Total Submissions"], "Value": [filtered_data.shape[0]]})
-    st.dataframe(summary, height=300)
+        summary = pd.DataFrame()
+    return df, numeric_cols, categorical_cols, summary
 
-    # ----------------- Interactive Charts -----------------
-    st.header("Interactive Charts")
+@st.cache_data(ttl=1800)
+def load_data(mtime):
+    """Load the downloaded CSV data; the file mtime keys the cache so new downloads are picked up."""
+    if mtime is None:
+        return describe_data(pd.DataFrame())
+    try:
+        df = parse_submission_dates(read_submissions(mtime))
+        # Narrower dtypes halve the memory every chart and aggregation has to stream through
+        return describe_data(downcast_numbers(compact_dtypes(df)))
+    except Exception as e:
+        st.error(f"Error reading CSV file: {e}")
+        return describe_data(pd.DataFrame())
 
-    # 1. Bar Chart: Distribution for a selected numeric column
-    st.subheader("Bar Chart")
-    if numeric_cols:
-        selected_bar = st.selectbox("Select a numeric column for Bar Chart", numeric_cols, key="bar")
-        bar_data = filtered_data[selected_bar].value_counts().reset_index()
-        bar_data.columns = [selected_bar, "Count"]
-        fig_bar = px.bar(bar_data, x=selected_bar, y="Count", title=f"Bar Chart of {selected_bar}")
-        st.plotly_chart(fig_bar)
-
-    # 2. Line Chart: Trend over time if a date column exists
-    st.subheader("Line Chart")
-    if "submission_date" in filtered_data.columns:
-        try:
-            filtered_data["submission_date"] = pd.to_datetime(filtered_data["submission_date"], errors="coerce")
-            line_data = filtered_data.groupby(filtered_data["submission_date"].dt.date).size().reset_index(name="Submissions")
-            fig_line = px.line(line_data, x="submission_date", y="Submissions", title="Submissions Over Time")
-            st.plotly_chart(fig_line)
-        except Exception as e:
-            st.error(f"Error processing 'submission_date' column: {e}")
-
-    # 3. Pie Chart: Distribution for a selected categorical column
-    st.subheader("Pie Chart")
-    categorical_cols = filtered_data.select_dtypes(include="object").columns.tolist()
-    if categorical_cols:
-        selected_pie = st.selectbox("Select a categorical column for Pie Chart", categorical_cols, key="pie")
-        pie_data = filtered_data[selected_pie].value_counts().reset_index()
-        pie_data.columns = [selected_pie, "Count"]
-        fig_pie = px.pie(pie_data, names=selected_pie, values="Count", title=f"Pie Chart of {selected_pie}")
-        st.plotly_chart(fig_pie)
-
-    # 4. Histogram: User selects an x-axis column and a y-axis column for aggregation
-    st.subheader("Histogram")
-    if numeric_cols:
-        selected_hist_x = st.selectbox("Select X-axis for Histogram", numeric_cols, key="hist_x")
-        selected_hist_y = st.selectbox("Select Y-axis for Histogram (Aggregation)", ["None"] + numeric_cols,
-                                       key="hist_y")
-        if selected_hist_y == "None":
-            fig_hist = px.histogram(filtered_data, x=selected_hist_x, title=f"Histogram of {selected_hist_x}")
-        else:
-            fig_hist = px.histogram(
-                filtered_data, x=selected_hist_x, y=selected_hist_y, histfunc="sum",
-                title=f"Histogram of {selected_hist_x} aggregated by {selected_hist_y}"
-            )
-        st.plotly_chart(fig_hist)
-
-    # 5. Scatter Plot: Relationship between two numeric columns
-    st.subheader("Scatter Plot")
-    if len(numeric_cols) >= 2:
-        scatter_x = st.selectbox("Select X-axis for Scatter Plot", numeric_cols, key="scatter_x")
-        scatter_y = st.selectbox("Select Y-axis for Scatter Plot", numeric_cols, key="scatter_y")
-        fig_scatter = px.scatter(filtered_data, x=scatter_x, y=scatter_y, title=f"Scatter Plot: {scatter_x} vs {scatter_y}")
-        st.plotly_chart(fig_scatter)
-
-    # 6. Box Plot: Distribution summary of a selected numeric column
-    st.subheader("Box Plot")
-    if numeric_cols:
-        selected_box = st.selectbox("Select a numeric column for Box Plot", numeric_cols, key="box")
-        fig_box = px.box(filtered_data, y=selected_box, title=f"Box Plot of {selected_box}")
-        st.plotly_chart(fig_box)
-
-    # 7. Correlation Heatmap: Shows correlations among numeric columns
-    st.subheader("Correlation Heatmap")
-    if len(numeric_cols) >= 2:
-        corr = filtered_data[numeric_cols].corr()
-        fig_heat = px.imshow(corr, text_auto=True, aspect="auto", title="Correlation Heatmap")
-        st.plotly_chart(fig_heat)
-
-    # 8. Violin Plot: Distribution for a selected numeric column with optional grouping
-    st.subheader("Violin Plot")
-    if numeric_cols:
-        selected_violin = st.selectbox("Select a numeric column for Violin Plot", numeric_cols, key="violin")
-        if categorical_cols:
-            group_by = st.selectbox("Group by (optional)", ["None"] + categorical_cols, key="violin_group")
-            if group_by == "None":
-                fig_violin = px.violin(filtered_data, y=selected_violin, box=True, points="all",
-                                       title=f"Violin Plot of {selected_violin}")
+def get_data_version():
+    """Return the CSV mtime, downloading the CSV only if it isn't on disk yet; None if unavailable."""
+    if not os.path.exists(CSV_FILE):
+        download_csv()
+    return os.path.getmtime(CSV_FILE) if os.path.exists(CSV_FILE) else None
+
+@st.cache_data(ttl=1800)
+def value_counts(_data, data_version, column):
+    """Count a column's non-missing values, most common first; ``data_version`` keys the cache."""
+    counts = _data[column].value_counts(dropna=True)
+    return counts[counts > 0]  # Categorical columns also list unused categories
+
+@st.cache_data(ttl=1800)
+def binned_counts(_data, data_version, column, bins=BAR_CHART_BINS):
+    """Count a numeric column in equal-width bins, labelled by bin centre."""
+    counts, edges = np.histogram(_data[column].dropna().to_numpy(), bins=bins)
+    return pd.DataFrame({column: (edges[:-1] + edges[1:]) / 2, "Count": counts})
+
+def pairwise_correlations(values, rows):
+    """Pairwise-complete Pearson correlations of columns ``rows`` of ``values`` against every column, in float64."""
+    # Matches DataFrame.corr()'s NaN handling, but as a handful of BLAS matrix products.
+    # The sums run in float64: in float32 they would lose the heatmap's precision on large exports.
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    # Centre on column means first so the one-pass sums below don't cancel catastrophically
+    means = np.where(present, values, 0).sum(axis=0, dtype=np.float64) / present.sum(axis=0)
+    centred = np.where(present, values - means, 0)
+    x, m = centred[:, rows], mask[:, rows]
+    count = m.T @ mask
+    sum_x, sum_y = x.T @ mask, m.T @ centred
+    cov = x.T @ centred - sum_x * sum_y / count
+    var_x = (x * x).T @ mask - sum_x**2 / count
+    var_y = m.T @ (centred * centred) - sum_y**2 / count
+    return cov / np.sqrt(var_x * var_y)
+
+@st.cache_data(ttl=1800)
+def correlation_matrix(_data, data_version, columns):
+    """Pearson correlations of the given numeric columns: float32 np.corrcoef for gap-free ones, float64 pairwise otherwise."""
+    block = _data[list(columns)]
+    values = block.to_numpy(dtype=np.float32, na_value=np.nan)
+    gappy = np.isnan(values).any(axis=0)
+    complete, rows = np.flatnonzero(~gappy), np.flatnonzero(gappy)
+    corr = np.empty((len(columns), len(columns)), dtype=np.float32)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if len(complete):
+            corr[np.ix_(complete, complete)] = np.corrcoef(values[:, complete], rowvar=False, dtype=np.float32)
+        if len(rows):
+            # Optional ODK fields have gaps; only pairs involving such a column need pairwise handling
+            pairwise = pairwise_correlations(values, rows)
+            corr[rows] = pairwise
+            corr[:, rows] = pairwise.T
+    return pd.DataFrame(corr, index=block.columns, columns=block.columns)
+
+def daily_counts(dates):
+    """Count UTC timestamps per day, including empty days, as a ``(date, "Submissions")`` frame."""
+    # One np.bincount over day offsets; pandas' resample/groupby machinery is ~20x slower here
+    days = dates.dropna().to_numpy(dtype="datetime64[D]")
+    first = days.min() if len(days) else np.datetime64(0, "D")
+    counts = np.bincount((days - first).astype(np.int64))
+    index = pd.DatetimeIndex((first + np.arange(len(counts))).astype("datetime64[ns]"), tz="UTC")
+    return pd.DataFrame({dates.name: index, "Submissions": counts})
+
+# ----------------- Chart Builders -----------------
+# Figures are cached per data version and selection, so changing one widget only rebuilds its own chart.
+
+@st.cache_data(ttl=1800)
+def make_bar_chart(_data, data_version, column):
+    """Bar chart of a numeric column, one bar per value or per bin for continuous columns."""
+    counts = value_counts(_data, data_version, column)
+    if len(counts) > BAR_CHART_MAX_VALUES:
+        # Continuous values are nearly all distinct, so count them in bins rather than per value
+        bar_data = binned_counts(_data, data_version, column)
+    else:
+        bar_data = counts.rename_axis(column).reset_index(name="Count")
+    return px.bar(bar_data, x=column, y="Count", title=f"Bar Chart of {column}")
+
+@st.cache_data(ttl=1800)
+def make_line_chart(_data, data_version):
+    """Line chart of submissions per day."""
+    line_data = daily_counts(_data["submission_date"])
+    return px.line(line_data, x="submission_date", y="Submissions", title="Submissions Over Time")
+
+@st.cache_data(ttl=1800)
+def make_pie_chart(_data, data_version, column):
+    """Pie chart of a categorical column's value counts."""
+    pie_data = value_counts(_data, data_version, column).rename_axis(column).reset_index(name="Count")
+    return px.pie(pie_data, names=column, values="Count", title=f"Pie Chart of {column}")
+
+@st.cache_data(ttl=1800)
+def make_histogram(_data, data_version, x, y=None):
+    """Histogram of ``x``, optionally summing ``y`` per bin."""
+    if y is None:
+        return px.histogram(_data, x=x, title=f"Histogram of {x}")
+    return px.histogram(_data, x=x, y=y, histfunc="sum", title=f"Histogram of {x} aggregated by {y}")
+
+@st.cache_data(ttl=1800)
+def make_scatter_plot(_data, data_version, x, y):
+    """Scatter plot of two numeric columns."""
+    return px.scatter(_data, x=x, y=y, title=f"Scatter Plot: {x} vs {y}")
+
+@st.cache_data(ttl=1800)
+def make_box_plot(_data, data_version, column):
+    """Box plot of a numeric column."""
+    return px.box(_data, y=column, title=f"Box Plot of {column}")
+
+@st.cache_data(ttl=1800)
+def make_heatmap(_data, data_version, columns):
+    """Correlation heatmap of the given numeric columns."""
+    corr = correlation_matrix(_data, data_version, columns)
+    return px.imshow(corr, text_auto=True, aspect="auto", title="Correlation Heatmap")
+
+@st.cache_data(ttl=1800)
+def make_violin_plot(_data, data_version, column, group_by=None):
+    """Violin plot of a numeric column, optionally split by a categorical column."""
+    if group_by is None:
+        return px.violin(_data, y=column, box=True, points="all", title=f"Violin Plot of {column}")
+    return px.violin(_data, y=column, color=group_by, box=True, points="all",
+                     title=f"Violin Plot of {column} grouped by {group_by}")
+
+# ----------------- Streamlit App Interface -----------------
+
+def main():
+    """Render the dashboard."""
+    # Sidebar Filters
+    st.sidebar.header("Filter Data")
+    data_version = get_data_version()
+    data, all_numeric_cols, all_categorical_cols, numeric_summary = load_data(data_version)
+    if not data.empty:
+        columns = st.sidebar.multiselect("Select Columns to Display", data.columns.tolist(), default=data.columns[:5].tolist())
+        filtered_data = data[columns]
+    else:
+        filtered_data = data
+    numeric_cols = [c for c in filtered_data.columns if c in all_numeric_cols]
+    categorical_cols = [c for c in filtered_data.columns if c in all_categorical_cols]
+
+    # Filterable Summary Section
+    st.title("Evaluating Mentorship Oversight: A Comprehensive Data Analysis")
+    st.write("### Filterable Column Summary")
+
+    if filtered_data.empty:
+        st.write("No data loaded yet. Please download the latest CSV to see the summary.")
+    else:
+        selected_column = st.selectbox("Select a Column for Summary", filtered_data.columns)
+        if selected_column:
+            # One value_counts pass serves the unique, most common, missing and frequent values
+            counts = value_counts(data, data_version, selected_column)
+            st.write(f"#### Summary of {selected_column}")
+            st.write(f"- **Unique Values:** {len(counts)}")
+            most_common = counts.index[0] if len(counts) else "N/A"
+            if len(counts) and selected_column in numeric_cols:
+                # value_counts widens float32 keys; print at column precision, not 49.558998...
+                most_common = str(filtered_data[selected_column].dtype.type(most_common))
+            st.write(f"- **Most Common Value:** {most_common}")
+            st.write(f"- **Missing Values:** {len(filtered_data) - counts.sum()}")
+            st.write(f"- **Data Type:** {filtered_data[selected_column].dtype}")
+
+            if selected_column not in numeric_cols:
+                st.write("- **Frequent Values:**")
+                st.write(counts.head())
             else:
-                fig_violin = px.violin(filtered_data, y=selected_violin, color=group_by, box=True, points="all",
-                                       title=f"Violin Plot of {selected_violin} grouped by {group_by}")
+                # Read the moments from the describe() computed once in load_data
+                stats = numeric_summary.set_index("Column").loc[selected_column]
+                st.write(f"- **Mean:** {stats['mean']:.2f}")
+                st.write(f"- **Median:** {stats['50%']:.2f}")
+                st.write(f"- **Standard Deviation:** {stats['std']:.2f}")
+
+    # Existing Summary Overview
+    st.header("Summary Overview")
+    if filtered_data.empty:
+        st.write("No data loaded yet. Please download the latest CSV to see the summary.")
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Submissions", filtered_data.shape[0])
+        with col2:
+            st.metric("Numeric Columns", len(numeric_cols))
+        with col3:
+            st.metric("Categorical Columns", len(categorical_cols))
+        if "submission_date" in filtered_data.columns:
+            try:
+                date_range = f"{filtered_data['submission_date'].min().date()} to {filtered_data['submission_date'].max().date()}"
+                st.write(f"Date Range: {date_range}")
+            except Exception:
+                st.write("Date Range: Not available")
+
+    if st.button("Download Latest CSV"):
+        if download_csv():
+            # New file on disk: drop the cached parse and every view derived from it, then redraw
+            st.cache_data.clear()
+            # Flag the download so its success message survives the rerun
+            st.session_state["csv_downloaded"] = True
+            st.rerun()
+    if st.session_state.pop("csv_downloaded", False):
+        st.success(f"CSV successfully downloaded to {CSV_FILE}")
+
+    if filtered_data.empty:
+        st.warning("No data available. Click the button above to fetch the latest CSV.")
+    else:
+        st.header("Tables")
+        st.subheader("Full Data")
+        # Ship one page of rows per rerun instead of serializing the whole frame to the browser
+        page_count = -(-len(filtered_data) // TABLE_PAGE_ROWS)
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="table_page")
+        start = (page - 1) * TABLE_PAGE_ROWS
+        page_data = filtered_data.iloc[start:start + TABLE_PAGE_ROWS]
+        st.dataframe(page_data, height=300)
+        st.caption(f"Rows {start + 1}-{start + len(page_data)} of {len(filtered_data)}")
+
+        # Summary Table
+        st.subheader("Summary")
+        if numeric_cols:
+            summary = numeric_summary[numeric_summary["Column"].isin(numeric_cols)]
         else:
-            fig_violin = px.violin(filtered_data, y=selected_violin, box=True, points="all",
-                                   title=f"Violin Plot of {selected_violin}")
-        st.plotly_chart(fig_violin)
+            summary = pd.DataFrame({"Metric": ["Total Submissions"], "Value": [filtered_data.shape[0]]})
+        st.dataframe(summary, height=300)
+
+        # ----------------- Interactive Charts -----------------
+        st.header("Interactive Charts")
+
+        # 1. Bar Chart: Distribution for a selected numeric column
+        st.subheader("Bar Chart")
+        if numeric_cols:
+            selected_bar = st.selectbox("Select a numeric column for Bar Chart", numeric_cols, key="bar")
+            st.plotly_chart(make_bar_chart(data, data_version, selected_bar))
+
+        # 2. Line Chart: Trend over time if a date column exists
+        st.subheader("Line Chart")
+        if "submission_date" in filtered_data.columns:
+            try:
+                st.plotly_chart(make_line_chart(data, data_version))
+            except Exception as e:
+                st.error(f"Error processing 'submission_date' column: {e}")
+
+        # 3. Pie Chart: Distribution for a selected categorical column
+        st.subheader("Pie Chart")
+        if categorical_cols:
+            selected_pie = st.selectbox("Select a categorical column for Pie Chart", categorical_cols, key="pie")
+            st.plotly_chart(make_pie_chart(data, data_version, selected_pie))
+
+        # 4. Histogram: User selects an x-axis column and a y-axis column for aggregation
+        st.subheader("Histogram")
+        if numeric_cols:
+            selected_hist_x = st.selectbox("Select X-axis for Histogram", numeric_cols, key="hist_x")
+            selected_hist_y = st.selectbox("Select Y-axis for Histogram (Aggregation)", ["None"] + numeric_cols,
+                                           key="hist_y")
+            hist_y = None if selected_hist_y == "None" else selected_hist_y
+            st.plotly_chart(make_histogram(data, data_version, selected_hist_x, hist_y))
+
+        # 5. Scatter Plot: Relationship between two numeric columns
+        st.subheader("Scatter Plot")
+        if len(numeric_cols) >= 2:
+            scatter_x = st.selectbox("Select X-axis for Scatter Plot", numeric_cols, key="scatter_x")
+            scatter_y = st.selectbox("Select Y-axis for Scatter Plot", numeric_cols, key="scatter_y")
+            st.plotly_chart(make_scatter_plot(data, data_version, scatter_x, scatter_y))
+
+        # 6. Box Plot: Distribution summary of a selected numeric column
+        st.subheader("Box Plot")
+        if numeric_cols:
+            selected_box = st.selectbox("Select a numeric column for Box Plot", numeric_cols, key="box")
+            st.plotly_chart(make_box_plot(data, data_version, selected_box))
+
+        # 7. Correlation Heatmap: Shows correlations among numeric columns
+        st.subheader("Correlation Heatmap")
+        if len(numeric_cols) >= 2:
+            st.plotly_chart(make_heatmap(data, data_version, tuple(numeric_cols)))
+
+        # 8. Violin Plot: Distribution for a selected numeric column with optional grouping
+        st.subheader("Violin Plot")
+        if numeric_cols:
+            selected_violin = st.selectbox("Select a numeric column for Violin Plot", numeric_cols, key="violin")
+            group_by = None
+            if categorical_cols:
+                selected_group = st.selectbox("Group by (optional)", ["None"] + categorical_cols, key="violin_group")
+                group_by = None if selected_group == "None" else selected_group
+            st.plotly_chart(make_violin_plot(data, data_version, selected_violin, group_by))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import requests
+import os
+import json
+import time
+import uuid
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Load environment variables
+load_dotenv()
+
+# ODK Central details from .env file
+ODK_SERVER = os.getenv("ODK_DOMAIN")
+USERNAME = os.getenv("ODK_EMAIL")
+PASSWORD = os.getenv("ODK_PASSWORD")
+PROJECT_ID = os.getenv("PROJECT_ID")  # Example: 1
+FORM_ID = os.getenv("FORM_ID")  # Example: "example_form"
+# A long-lived API token (e.g. an app user's) skips the email/password session login
+ODK_TOKEN = os.getenv("ODK_TOKEN")
+AUTH = "bearer" if ODK_TOKEN else "session"
+
+# Directory to save CSV files
+OUTPUT_DIR = "odk_submissions"
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+CSV_FILE = f"{OUTPUT_DIR}/{FORM_ID}_submissions.csv"
+CHUNK_SIZE = 1 << 20  # Stream downloads to disk 1 MiB at a time
+# Validators of the last downloaded CSV, sent back as conditional GET headers
+CSV_META_FILE = "csv_meta.json"
+
+# Session tokens are also stored on disk, so other processes and restarts reuse them
+TOKEN_FILE = "odk_token.json"
+TOKEN_TTL = 3600  # Assume 1-hour token validity
+TOKEN_EXPIRY_MARGIN = 60  # Log in again this many seconds before the assumed expiry
+TOKEN = {"value": ODK_TOKEN, "expiry": float("inf") if ODK_TOKEN else 0}
+
+# Keep one pooled connection to ODK Central alive across downloads,
+# retrying transient gateway errors instead of failing the download
+SESSION = requests.Session()
+RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+for scheme in ("https://", "http://"):
+    SESSION.mount(scheme, HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=RETRIES))
+
+def get_odk_token():
+    """Log in to ODK Central and store the new session token. Raises requests.RequestException on failure."""
+    url = f"{ODK_SERVER}/v1/sessions"
+    data = {"email": USERNAME, "password": PASSWORD}
+
+    response = SESSION.post(url, json=data)
+    response.raise_for_status()
+    token = response.json().get("token")
+    expiry = time.time() + TOKEN_TTL
+    TOKEN.update(value=token, expiry=expiry)
+    write_json(TOKEN_FILE, {"token": token, "expiry": expiry})
+    return token
+
+def load_token():
+    """Return a valid token, logging in only when the cached one is missing or about to expire."""
+    if time.time() < TOKEN["expiry"] - TOKEN_EXPIRY_MARGIN:
+        return TOKEN["value"]
+    # A missing or unreadable token file just means logging in again
+    token_data = read_json(TOKEN_FILE)
+    if token_data.get("token") and time.time() < token_data.get("expiry", 0) - TOKEN_EXPIRY_MARGIN:
+        TOKEN.update(value=token_data["token"], expiry=token_data["expiry"])
+        return token_data["token"]
+    return get_odk_token()
+
+def read_json(path):
+    """Return the JSON object stored at ``path``, or {} if it is missing or unreadable."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def write_json(path, data):
+    """Write ``data`` as JSON through a unique temp file, so other processes never read a partial file."""
+    tmp_file = f"{path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, path)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+def load_csv_meta():
+    """Load the stored validators of the last download, if the CSV on disk is still that download."""
+    if os.path.exists(CSV_FILE):
+        meta = read_json(CSV_META_FILE)
+        # Ignore validators for a CSV that has since been replaced or edited
+        if meta.get("mtime") == os.path.getmtime(CSV_FILE):
+            return meta
+    return {}
+
+def save_csv_meta(response):
+    """Store the validators of a completed download for the next conditional GET."""
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "mtime": os.path.getmtime(CSV_FILE),
+    }
+    write_json(CSV_META_FILE, meta)
+
+def download_csv():
+    """Download submissions to CSV_FILE, skipping the transfer if nothing changed.
+
+    Returns True if a new CSV was written and False if the server had nothing new.
+    Raises requests.RequestException if logging in or downloading fails.
+    """
+    url = f"{ODK_SERVER}/v1/projects/{PROJECT_ID}/forms/{FORM_ID}/submissions.csv"
+    # CSV compresses well; iter_content() transparently inflates the gzip body as it streams
+    headers = {"Authorization": f"Bearer {load_token()}", "Accept-Encoding": "gzip, deflate"}
+    meta = load_csv_meta()
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = SESSION.get(url, headers=headers, stream=True)
+    if response.status_code == 401 and AUTH == "session":
+        # Session token expired or revoked, log in again and retry once
+        response.close()
+        headers["Authorization"] = f"Bearer {get_odk_token()}"
+        response = SESSION.get(url, headers=headers, stream=True)
+    with response:
+        if response.status_code == 304:
+            # Nothing new on the server; keep the CSV (and its mtime-keyed caches) as is
+            return False
+        response.raise_for_status()
+
+        # Write to a temp file so a dropped connection never leaves a truncated CSV behind.
+        # Its name is unique per download, as the app and the scheduler may download at once.
+        tmp_file = f"{CSV_FILE}.{uuid.uuid4().hex}.part"
+        try:
+            with open(tmp_file, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(tmp_file, CSV_FILE)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        save_csv_meta(response)
+    return True
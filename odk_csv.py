@@ -1,59 +1,16 @@
 import requests
-import os
 import time
 import schedule
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# ODK Central details from .env file
-ODK_SERVER = os.getenv("ODK_DOMAIN")
-USERNAME = os.getenv("ODK_EMAIL")
-PASSWORD = os.getenv("ODK_PASSWORD")
-PROJECT_ID = os.getenv("PROJECT_ID")  # Example: 1
-FORM_ID = os.getenv("FORM_ID")  # Example: "example_form"
-
-# Directory to save CSV files
-OUTPUT_DIR = "odk_submissions"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def get_odk_token():
-    """Authenticate with ODK Central and retrieve an API token."""
-    url = f"{ODK_SERVER}/v1/sessions"
-    data = {"email": USERNAME, "password": PASSWORD}
-    
-    try:
-        response = requests.post(url, json=data)
-        response.raise_for_status()  # Raise error if request fails
-        token = response.json().get("token")
-        return token
-    except requests.RequestException as e:
-        print(f"Error obtaining ODK token: {e}")
-        return None
+import odk_client
+from odk_client import CSV_FILE
 
 def download_csv():
-    """Download ODK submissions as a CSV file."""
-    token = get_odk_token()
-    print(token)
-    if not token:
-        print("❌ Could not authenticate. Skipping CSV download.")
-        return
-    
-    url = f"{ODK_SERVER}/v1/projects/{PROJECT_ID}/forms/{FORM_ID}/submissions.csv"
-    headers = {"Authorization": f"Bearer {token}"}
-
+    """Download ODK submissions as a CSV file, skipping the transfer if nothing changed."""
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        # Save CSV file
-        filename = f"{OUTPUT_DIR}/{FORM_ID}_submissions.csv"
-        with open(filename, "wb") as f:
-            f.write(response.content)
-
-        print(f"✅ Successfully downloaded: {filename}")
-
+        if odk_client.download_csv():
+            print(f"✅ Successfully downloaded: {CSV_FILE}")
+        else:
+            print(f"✅ No new submissions, keeping: {CSV_FILE}")
     except requests.RequestException as e:
         print(f"❌ Failed to download CSV: {e}")
 
@@ -63,8 +20,13 @@ def run_periodically():
 
     print("⏳ Scheduled CSV downloads every 10 minutes...")
     while True:
+        # Sleep exactly until the next job is due instead of polling every minute
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break  # No jobs left
+        if idle > 0:
+            time.sleep(idle)
         schedule.run_pending()
-        time.sleep(60)  # Wait before checking again
 
 if __name__ == "__main__":
     download_csv()  # Run immediately